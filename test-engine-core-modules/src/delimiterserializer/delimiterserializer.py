@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import csv
-from typing import Any
+from typing import Any, Dict, Iterator, List, Optional, TextIO, Tuple
 
 from test_engine_core.interfaces.iserializer import ISerializer
 from test_engine_core.plugins.enums.delimiter_type import DelimiterType
@@ -10,6 +10,21 @@ from test_engine_core.plugins.enums.serializer_plugin_type import SerializerPlug
 from test_engine_core.plugins.metadata.delimiter_metadata import DelimiterMetadata
 from test_engine_core.plugins.metadata.plugin_metadata import PluginMetadata
 
+# list of supported separated values. list can be expanded in the future
+_SUPPORTED_SEPARATED_VALUES: List[Tuple[DelimiterType, str]] = [
+    (DelimiterType.COMMA, ","),
+    (DelimiterType.TAB, "\t"),
+    (DelimiterType.SEMICOLON, ";"),
+    (DelimiterType.PIPE, "|"),
+    (DelimiterType.SPACE, " "),
+    (DelimiterType.COLON, ":"),
+]
+# lookup of the supported separated values by delimiter character
+_DELIMITER_MAP: Dict[str, Tuple[DelimiterType, str]] = {
+    separated_value[1]: separated_value
+    for separated_value in _SUPPORTED_SEPARATED_VALUES
+}
+
 
 # NOTE: Do not change the class name, else the plugin cannot be read by the system
 class Plugin(ISerializer):
@@ -26,6 +41,11 @@ class Plugin(ISerializer):
     _metadata: PluginMetadata = PluginMetadata(_name, _description, _version)
     _plugin_type: PluginType = PluginType.SERIALIZER
     _serializer_plugin_type: SerializerPluginType = SerializerPluginType.DELIMITER
+    # Delimiter detection is performed on a capped sample of the file
+    _sniff_sample_size: int = 16 * 1024
+    _sniff_delimiters: str = "".join(_DELIMITER_MAP)
+    # Larger read buffer to reduce the number of read calls on big files
+    _read_buffer_size: int = 1 << 20
 
     @staticmethod
     def get_metadata() -> PluginMetadata:
@@ -48,64 +68,120 @@ class Plugin(ISerializer):
         return Plugin._plugin_type
 
     @staticmethod
-    def deserialize_data(data_path: str) -> Any:
+    def deserialize_data(data_path: str, delimiter: Optional[str] = None) -> Any:
         """
         A method to read the data path and attempt to deserialize it
 
         Args:
             data_path (str): data path that is serialized
+            delimiter (Optional[str]): delimiter of the data if it is known. Delimiter detection
+            is skipped when provided. Defaults to None.
 
         Returns:
             Any: deserialized data
         """
-        # list of supported separated values. list can be expanded in the future
-        supported_separated_values_list = [
-            (DelimiterType.COMMA, ","),
-            (DelimiterType.TAB, "\t"),
-            (DelimiterType.SEMICOLON, ";"),
-            (DelimiterType.PIPE, "|"),
-            (DelimiterType.SPACE, " "),
-            (DelimiterType.COLON, ":"),
-        ]
-
         # check if file can be parsed properly and if the delimiter is supported. if not, raise an error
+        with open(data_path, "r", buffering=Plugin._read_buffer_size) as text_file:
+            detected_delimiter_tuple = Plugin._get_delimiter_tuple(text_file, delimiter)
+            reader = csv.reader(text_file, delimiter=detected_delimiter_tuple[1])
+            list_data_with_delimiter = list(reader)
+            delimiter_instance = DelimiterMetadata(
+                list_data_with_delimiter, detected_delimiter_tuple, data_path
+            )
+            return delimiter_instance
+
+    @staticmethod
+    def deserialize_data_iter(
+        data_path: str, delimiter: Optional[str] = None
+    ) -> Iterator[List[str]]:
+        """
+        A method to read the data path and deserialize it row by row.
+        Rows are read from the file on demand instead of being loaded into a list, so consumers
+        that only scan the data once hold a single row in memory instead of the whole file.
+
+        Args:
+            data_path (str): data path that is serialized
+            delimiter (Optional[str]): delimiter of the data if it is known. Delimiter detection
+            is skipped when provided. Defaults to None.
+
+        Raises:
+            ValueError: Exception if the delimiter is not supported. As this is a generator,
+            errors are only raised when the first row is requested.
+
+        Yields:
+            Iterator[List[str]]: deserialized rows of the data
+        """
+        with open(data_path, "r", buffering=Plugin._read_buffer_size) as text_file:
+            detected_delimiter_tuple = Plugin._get_delimiter_tuple(text_file, delimiter)
+            yield from csv.reader(text_file, delimiter=detected_delimiter_tuple[1])
+
+    @staticmethod
+    def _get_delimiter_tuple(
+        text_file: TextIO, delimiter: Optional[str]
+    ) -> Tuple[DelimiterType, str]:
+        """
+        A method to get the supported delimiter of the text file. The text file is rewound
+        to the start after the delimiter is detected.
+
+        Args:
+            text_file (TextIO): text file to be read
+            delimiter (Optional[str]): delimiter of the data if it is known
+
+        Raises:
+            ValueError: Exception if the delimiter is not supported
+
+        Returns:
+            Tuple[DelimiterType, str]: the delimiter type and character of the data
+        """
+        if delimiter is None:
+            # only sniff a capped sample of the file instead of the whole file
+            delimiter = Plugin._detect_delimiter(
+                text_file.read(Plugin._sniff_sample_size)
+            )
+            text_file.seek(0)
+
+        detected_delimiter_tuple = _DELIMITER_MAP.get(delimiter)
+
+        # if delimiter is not found in our list of supported delimiters
+        if not detected_delimiter_tuple:
+            raise ValueError("The delimiter is not supported.")
+
+        return detected_delimiter_tuple
+
+    @staticmethod
+    def _detect_delimiter(sample: str) -> str:
+        """
+        A method to detect the delimiter used in the sample data
+
+        Args:
+            sample (str): sample of the data to be sniffed
+
+        Returns:
+            str: the detected delimiter. Comma is returned if the data only has a single column
+            or if the only candidate delimiter is a letter or digit
+        """
+        try:
+            # restrict the candidates to the supported delimiters, so the sniffer does not
+            # go through every ascii character
+            return (
+                csv.Sniffer()
+                .sniff(sample, delimiters=Plugin._sniff_delimiters)
+                .delimiter
+            )
+        except csv.Error:
+            pass
+
         try:
-            with open(data_path, "r") as text_file:
-                list_data = list(csv.reader(text_file))
-                # check if SV file only has a single column by checking for presence of supported SVs
-                if all(
-                    supported_separated_value[1] not in list_data[0][0]
-                    for supported_separated_value in supported_separated_values_list
-                ):
-                    delimiter_tuple = (DelimiterType.COMMA, ",")
-                    delimiter_instance = DelimiterMetadata(
-                        list_data, delimiter_tuple, data_path
-                    )
-                    return delimiter_instance
-                else:
-                    dialect = csv.Sniffer().sniff(text_file.read(4096))
-                    detected_delimiter_tuple = None
-                    for count, item in enumerate(supported_separated_values_list):
-                        if (
-                            dialect.delimiter
-                            == supported_separated_values_list[count][1]
-                        ):
-                            detected_delimiter_tuple = item
-                            break
-
-                    # if delimiter is not found in our list of supported delimiters
-                    if not detected_delimiter_tuple:
-                        raise ValueError("The delimiter is not supported.")
-
-                    text_file.seek(0)
-                    reader = csv.reader(text_file, delimiter=dialect.delimiter)
-                    list_data_with_delimiter = list(reader)
-                    delimiter_instance = DelimiterMetadata(
-                        list_data_with_delimiter, detected_delimiter_tuple, data_path
-                    )
-                    return delimiter_instance
-        except Exception:
-            raise
+            # check if the data is separated by an unsupported delimiter
+            delimiter = csv.Sniffer().sniff(sample).delimiter
+        except csv.Error:
+            # data only has a single column
+            return ","
+
+        # the sniffer may pick a letter or digit that is shared by the values of a single column
+        if delimiter.isalnum():
+            return ","
+        return delimiter
 
     @staticmethod
     def get_serializer_plugin_type() -> SerializerPluginType:
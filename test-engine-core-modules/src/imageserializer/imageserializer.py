@@ -63,24 +63,21 @@ class Plugin(ISerializer):
             (ImageType.JPEG, ".jpeg"),
         ]
 
-        try:
-            # Check the file is of what extension
-            detected_image_type = None
-            image_file = Path(data_path)
-            for count, item in enumerate(supported_image_type_list):
-                if image_file.suffix == supported_image_type_list[count][1]:
-                    detected_image_type = supported_image_type_list[count][0]
-                    break
-
-            # If image type is not supported
-            if not detected_image_type:
-                raise ValueError("The image type is not supported.")
-
-            # Get the image instance
-            image_instance = ImageMetadata(None, detected_image_type, data_path)
-            return image_instance
-        except Exception:
-            raise
+        # Check the file is of what extension
+        detected_image_type = None
+        image_file = Path(data_path)
+        for count, item in enumerate(supported_image_type_list):
+            if image_file.suffix == supported_image_type_list[count][1]:
+                detected_image_type = supported_image_type_list[count][0]
+                break
+
+        # If image type is not supported
+        if not detected_image_type:
+            raise ValueError("The image type is not supported.")
+
+        # Get the image instance
+        image_instance = ImageMetadata(None, detected_image_type, data_path)
+        return image_instance
 
     @staticmethod
     def get_serializer_plugin_type() -> SerializerPluginType:
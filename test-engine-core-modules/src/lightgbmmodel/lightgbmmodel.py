@@ -131,14 +131,11 @@ class Plugin(IModel):
         Returns:
             Any: predicted result
         """
-        try:
-            if isinstance(data, list):
-                for item in data:
-                    return self._model.predict(item)
-            else:
-                return self._model.predict(data)
-        except Exception:
-            raise
+        if isinstance(data, list):
+            for item in data:
+                return self._model.predict(item)
+        else:
+            return self._model.predict(data)
 
     def predict_proba(self, data: Any, *args) -> Any:
         """
@@ -150,10 +147,7 @@ class Plugin(IModel):
         Returns:
             Any: predicted result
         """
-        try:
-            return self._model.predict_proba(data)
-        except Exception:
-            raise
+        return self._model.predict_proba(data)
 
     def score(self, data: Any, y_true: Any) -> Any:
         """
@@ -166,10 +160,7 @@ class Plugin(IModel):
         Returns:
             Any: score result
         """
-        try:
-            return self._model.score(data, y_true)
-        except Exception:
-            raise
+        return self._model.score(data, y_true)
 
     def _identify_model_algorithm(self, model: Any) -> Tuple[bool, str]:
         """
@@ -1,9 +1,12 @@
 import asyncio
 import functools
+import hashlib
 import http
 import json
 import pathlib
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum, auto
 from typing import Any, Callable, Dict, List, Tuple, Union
 
@@ -14,7 +17,8 @@ import numpy as np
 import pandas as pd
 from aiopenapi3 import FileSystemLoader, OpenAPI
 from httpx import Response
-from openapi_schema_validator import OAS30Validator, validate
+from jsonschema.exceptions import best_match
+from openapi_schema_validator import OAS30Validator
 from test_engine_core.interfaces.imodel import IModel
 from test_engine_core.plugins.enums.model_plugin_type import ModelPluginType
 from test_engine_core.plugins.enums.plugin_type import PluginType
@@ -48,7 +52,17 @@ class Plugin(IModel):
     _model_plugin_type: ModelPluginType = ModelPluginType.API
     _api_instance: Any = None
     _api_instance_schema: Any = None
+    _api_instance_cache: OrderedDict[bytes, OpenAPI] = OrderedDict()
+    _api_instance_cache_size: int = 32
+    # Supported requestBody content types, in order of preference
+    _api_request_body_content_types: Tuple[str, ...] = (
+        "application/json",
+        "multipart/form-data",
+        "application/x-www-form-urlencoded",
+    )
     _api_validator: Any = OAS30Validator
+    _api_validator_cache: OrderedDict[int, Tuple[Dict, Any]] = OrderedDict()
+    _api_validator_cache_size: int = 32
     _api_schema: Dict = None
     _api_config: Dict = None
     # OpenAPI custom transport variables
@@ -72,8 +86,14 @@ class Plugin(IModel):
     _api_batch_limit: int = _api_batch_limit_default
     _api_max_connections: int = _api_max_connections_default
     _api_connection_retries: int = _api_connection_retries_default
+    # OpenAPI custom transports shared by the async clients, one for each set of request options
+    _api_transports: Dict[Tuple, "OpenAPICustomTransport"] = dict()
+    # Event loop that runs the OpenAPI requests in a background thread
+    _api_event_loop: Union[asyncio.AbstractEventLoop, None] = None
+    _api_event_loop_thread: Union[threading.Thread, None] = None
+    _api_event_loop_users: int = 0
+    _api_event_loop_lock: threading.Lock = threading.Lock()
     # OpenAPI request error
-    _lock = asyncio.Lock()
     _response_error_message: str = ""
 
     @staticmethod
@@ -124,24 +144,68 @@ class Plugin(IModel):
                 Plugin._api_connection_timeout, connect=Plugin._api_connection_timeout
             )
         kwargs["timeout"] = httpx_timeout
-        kwargs["transport"] = OpenAPICustomTransport(
-            verify=Plugin._api_ssl_verify,
-            cert=Plugin._api_ssl_cert,
-            rate_limit=Plugin._api_rate_limit,
-            rate_limit_timeout=Plugin._api_rate_limit_timeout,
-            batch_strategy=Plugin._api_batch_strategy,
-            batch_limit=Plugin._api_batch_limit,
-            max_connections=Plugin._api_max_connections,
-            connection_retries=Plugin._api_connection_retries,
-            response_error_callback=Plugin._notify_response_error,
-        )
+        kwargs["transport"] = Plugin._get_api_transport()
 
         return httpx.AsyncClient(*args, **kwargs)
 
+    @staticmethod
+    def _get_api_transport() -> "OpenAPICustomTransport":
+        """
+        A method to return the custom transport module that is shared by the async clients, so that
+        connections are kept alive and reused instead of being set up again for every request.
+        A custom transport module is kept for each set of request options, so plugins with different
+        request options do not replace each other's transport module while requests are in flight.
+        The transport modules are closed when the event loop is stopped.
+
+        Returns:
+            OpenAPICustomTransport: Returns the shared custom transport module
+        """
+        transport_settings = (
+            Plugin._api_ssl_verify,
+            Plugin._api_ssl_cert,
+            Plugin._api_rate_limit,
+            Plugin._api_rate_limit_timeout,
+            Plugin._api_batch_strategy,
+            Plugin._api_batch_limit,
+            Plugin._api_max_connections,
+            Plugin._api_connection_retries,
+        )
+        api_transport = Plugin._api_transports.get(transport_settings)
+        if api_transport is None:
+            api_transport = OpenAPICustomTransport(
+                verify=Plugin._api_ssl_verify,
+                cert=Plugin._api_ssl_cert,
+                rate_limit=Plugin._api_rate_limit,
+                rate_limit_timeout=Plugin._api_rate_limit_timeout,
+                batch_strategy=Plugin._api_batch_strategy,
+                batch_limit=Plugin._api_batch_limit,
+                max_connections=Plugin._api_max_connections,
+                connection_retries=Plugin._api_connection_retries,
+                response_error_callback=Plugin._notify_response_error,
+            )
+            Plugin._api_transports[transport_settings] = api_transport
+        return api_transport
+
+    @staticmethod
+    async def _close_api_transport() -> None:
+        """
+        An async method to close the connections of the shared custom transport modules
+        """
+        api_transports = list(Plugin._api_transports.values())
+        Plugin._api_transports.clear()
+        for api_transport in api_transports:
+            await api_transport.close_connections()
+
     def __init__(self, **kwargs) -> None:
         # Configuration
         self._is_setup_completed = False
         self._api_instance = None
+        self._api_instance_cache_key = None
+        self._predict_api_method = ""
+        self._predict_api_headers = dict()
+        self._predict_api_body_type = None
+        self._last_validated = None
+        self._is_event_loop_acquired = False
         api_schema = kwargs.get("api_schema", None)
         api_config = kwargs.get("api_config", None)
 
@@ -154,9 +218,74 @@ class Plugin(IModel):
 
     def cleanup(self) -> None:
         """
-        A method to clean-up objects
+        A method to clean-up objects.
+        The cached api instance of this plugin is evicted, so its credentials are not kept in memory.
+        The shared event loop and connections are only stopped when the last plugin using them is cleaned up,
+        so requests of other plugins that are still in flight are not affected.
         """
-        pass
+        if self._api_instance_cache_key is not None:
+            Plugin._api_instance_cache.pop(self._api_instance_cache_key, None)
+            self._api_instance_cache_key = None
+
+        with Plugin._api_event_loop_lock:
+            if not self._is_event_loop_acquired:
+                return
+
+            self._is_event_loop_acquired = False
+            Plugin._api_event_loop_users -= 1
+            if Plugin._api_event_loop_users == 0:
+                Plugin._stop_event_loop()
+
+    def _acquire_event_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        A method to return the shared event loop that runs the OpenAPI requests.
+        The plugin is registered as a user of the event loop until it is cleaned up.
+
+        Returns:
+            asyncio.AbstractEventLoop: Returns the running event loop
+        """
+        with Plugin._api_event_loop_lock:
+            if not self._is_event_loop_acquired:
+                self._is_event_loop_acquired = True
+                Plugin._api_event_loop_users += 1
+            return Plugin._get_event_loop()
+
+    @staticmethod
+    def _get_event_loop() -> asyncio.AbstractEventLoop:
+        """
+        A method to return the event loop that runs the OpenAPI requests.
+        The event loop is started in a background thread and persists across the requests,
+        so the connections of the shared custom transport module can be reused.
+        It is called with the event loop lock held.
+
+        Returns:
+            asyncio.AbstractEventLoop: Returns the running event loop
+        """
+        if Plugin._api_event_loop is None:
+            Plugin._api_event_loop = asyncio.new_event_loop()
+            Plugin._api_event_loop_thread = threading.Thread(
+                target=Plugin._api_event_loop.run_forever, daemon=True
+            )
+            Plugin._api_event_loop_thread.start()
+        return Plugin._api_event_loop
+
+    @staticmethod
+    def _stop_event_loop() -> None:
+        """
+        A method to close the shared connections and stop the event loop that runs the OpenAPI requests.
+        It is called with the event loop lock held.
+        """
+        if Plugin._api_event_loop is None:
+            return
+
+        asyncio.run_coroutine_threadsafe(
+            Plugin._close_api_transport(), Plugin._api_event_loop
+        ).result()
+        Plugin._api_event_loop.call_soon_threadsafe(Plugin._api_event_loop.stop)
+        Plugin._api_event_loop_thread.join()
+        Plugin._api_event_loop.close()
+        Plugin._api_event_loop = None
+        Plugin._api_event_loop_thread = None
 
     def setup(self) -> Tuple[bool, str]:
         """
@@ -177,11 +306,9 @@ class Plugin(IModel):
             # Set the prediction operationId
             path_to_be_updated = self._api_schema["paths"]
             if len(path_to_be_updated) > 0:
-                first_api = list(path_to_be_updated.items())[0]
-                first_api_value = first_api[1]
+                first_api_value = next(iter(path_to_be_updated.values()))
                 if len(first_api_value) > 0:
-                    first_api_http = list(first_api_value.items())[0]
-                    first_api_http_value = first_api_http[1]
+                    first_api_http_value = next(iter(first_api_value.values()))
                     first_api_http_value.update({"operationId": "predict_api"})
 
             # Update session variables if necessary
@@ -222,17 +349,32 @@ class Plugin(IModel):
             # Perform input validation
             self._validate_input()
 
-            # Create the api instance based on the provided api schema
-            self._api_instance = OpenAPI.loads(
-                url="",
-                data=json.dumps(self._api_schema),
-                session_factory=Plugin.custom_session_factory,
-                loader=FileSystemLoader(pathlib.Path("")),
-                use_operation_tags=True,
-            )
-
-            # Setup API Authentication
-            self._setup_api_authentication()
+            # Create and authenticate the api instance based on the provided api schema
+            self._setup_api_instance()
+
+            # Start the event loop for the api requests
+            api_event_loop = self._acquire_event_loop()
+
+            # Resolve the prediction api details once, so that the requests do not look them up again.
+            # A new request object is still used for every request as it holds the request state.
+            predict_api = self._api_instance._.predict_api
+            self._predict_api_method = predict_api.method.lower()
+            if self._predict_api_method == "post":
+                self._api_instance_schema = asyncio.run_coroutine_threadsafe(
+                    self.get_schema_content(), api_event_loop
+                ).result()
+                self._predict_api_body_type = self._api_instance_schema.get_type()
+                # Populate headers with the required header parameters
+                self._predict_api_headers = dict()
+                for parameter in predict_api.parameters:
+                    if (
+                        str(parameter.in_.name).lower() == "header"
+                        and parameter.required
+                        and parameter.schema_.enum
+                    ):
+                        self._predict_api_headers.update(
+                            {parameter.name: parameter.schema_.enum[0]}
+                        )
 
             # Setup completed
             self._is_setup_completed = True
@@ -282,7 +424,9 @@ class Plugin(IModel):
         """
         # Call the function to make multiple requests
         try:
-            return asyncio.run(self.make_request(data, *args))
+            return asyncio.run_coroutine_threadsafe(
+                self.make_request(data, *args), self._acquire_event_loop()
+            ).result()
         except:
             raise RuntimeError("Unable to send request to API Server. Please ensure that the URL is correct.")
 
@@ -299,7 +443,9 @@ class Plugin(IModel):
         """
         # Call the function to make multiple requests
         try:
-            return asyncio.run(self.make_request(data, *args))
+            return asyncio.run_coroutine_threadsafe(
+                self.make_request(data, *args), self._acquire_event_loop()
+            ).result()
         except:
             raise RuntimeError("Unable to send request to API Server. Please ensure that the URL is correct.")
 
@@ -324,8 +470,7 @@ class Plugin(IModel):
         Returns:
             str: Contains the error message
         """
-        async with Plugin._lock:
-            return Plugin._response_error_message
+        return Plugin._response_error_message
 
     @staticmethod
     async def _notify_response_error(error_message: str):
@@ -335,8 +480,8 @@ class Plugin(IModel):
         Args:
             error_message (str): Contains the error message
         """
-        async with Plugin._lock:
-            Plugin._response_error_message = error_message
+        # No lock is needed as there is no await between reading and setting the message
+        Plugin._response_error_message = error_message
 
     async def get_schema_content(self) -> Any:
         """
@@ -349,29 +494,12 @@ class Plugin(IModel):
         Returns:
             Any: API schema content
         """
-        if (
-            "application/json"
-            in self._api_instance._.predict_api.operation.requestBody.content
-        ):
-            return self._api_instance._.predict_api.operation.requestBody.content[
-                "application/json"
-            ].schema_
-        elif (
-            ct := "multipart/form-data"
-        ) in self._api_instance._.predict_api.operation.requestBody.content:
-            return self._api_instance._.predict_api.operation.requestBody.content[
-                ct
-            ].schema_
-        elif (
-            ct := "application/x-www-form-urlencoded"
-        ) in self._api_instance._.predict_api.operation.requestBody.content:
-            return self._api_instance._.predict_api.operation.requestBody.content[
-                ct
-            ].schema_
-        else:
-            raise NotImplementedError(
-                self._api_instance._.predict_api.operation.requestBody.content
-            )
+        content = self._api_instance._.predict_api.operation.requestBody.content
+        for content_type in Plugin._api_request_body_content_types:
+            media_type = content.get(content_type)
+            if media_type is not None:
+                return media_type.schema_
+        raise NotImplementedError(content)
 
     async def get_data_payload(
         self, data_row: Union[List, pd.Series], data_labels: Tuple[Any, ...]
@@ -450,25 +578,15 @@ class Plugin(IModel):
               header parameters specified in the API schema.
             - If the API method is "GET," the method sends the row_data_to_send dictionary as parameters in the
             API request URL without a request body.
-            - The method retrieves the API schema by calling the get_schema_content method, and it uses the API
-            instance's predict_api attribute to access the API details.
+            - The method uses the API schema, headers and the predict_api details that are resolved during setup.
             - The method returns the API response object containing the results of the API request.
         """
         row_data_to_send = await self.get_data_payload(row, *args)
-        if self._api_instance._.predict_api.method.lower() == "post":
-            # POST method. Get API Instance schema
-            self._api_instance_schema = await self.get_schema_content()
-            # Populate headers
-            headers = dict()
-            for parameter in self._api_instance._.predict_api.parameters:
-                if str(parameter.in_.name).lower() == "header" and parameter.required:
-                    if len(parameter.schema_.enum) > 0:
-                        headers.update({parameter.name: parameter.schema_.enum[0]})
-
-            # Populate body with payload values
-            body = self._api_instance_schema.get_type().construct(**row_data_to_send)
+        if self._predict_api_method == "post":
+            # POST method. Populate body with payload values
+            body = self._predict_api_body_type.construct(**row_data_to_send)
             headers, data, result = await self._api_instance._.predict_api.request(
-                parameters=headers, data=body
+                parameters=self._predict_api_headers, data=body
             )
         else:
             # GET method. Populate body with payload values
@@ -498,8 +616,7 @@ class Plugin(IModel):
               header parameters specified in the API schema.
             - If the API method is "GET," the method sends the row_data_to_send dictionary as parameters in the
             API request URL without a request body.
-            - The method retrieves the API schema by calling the get_schema_content method, and it uses the API
-            instance's predict_api attribute to access the API details.
+            - The method uses the API schema, headers and the predict_api details that are resolved during setup.
             - The method returns the API response object containing the results of the API request.
         """
         list_of_processed_rows = []
@@ -507,19 +624,11 @@ class Plugin(IModel):
             row_data_to_send = await self.get_data_payload(row, *args)
             list_of_processed_rows.append(row_data_to_send)
 
-        if self._api_instance._.predict_api.method.lower() == "post":
-            # POST method. Get API Instance schema
-            self._api_instance_schema = await self.get_schema_content()
-            # Populate headers
-            headers = dict()
-            for parameter in self._api_instance._.predict_api.parameters:
-                if str(parameter.in_.name).lower() == "header" and parameter.required:
-                    if len(parameter.schema_.enum) > 0:
-                        headers.update({parameter.name: parameter.schema_.enum[0]})
-            # Populate body with payload values
+        if self._predict_api_method == "post":
+            # POST method. Populate body with payload values
             headers, data, result = await self._api_instance._.predict_api.request(
-                parameters=headers, data=list_of_processed_rows
-                )
+                parameters=self._predict_api_headers, data=list_of_processed_rows
+            )
         else:
             # GET method. Populate body with payload values
             body = None
@@ -551,7 +660,9 @@ class Plugin(IModel):
             - It prepares the row information for the payload or headers using the `get_data_payload` method, which
             takes the row and any additional arguments (*args) as input.
             - The row information is then passed to the `send_request` method to make the API request and
-            obtain the response.
+            obtain the response. With the application/json batch strategy, the rows are grouped by the batch
+            limit and each group is passed to the `send_batched_request` method instead.
+            - The requests are sent concurrently, bounded by the max connections and the rate limit.
             - The response text from each API request is appended to the `response_data` list.
             - Finally, the method returns the `response_data` list containing the response text from
             all the API requests.
@@ -559,53 +670,36 @@ class Plugin(IModel):
 
         start_time = time.time()
         response_data = list()
-        new_list_of_data = []
+
+        # Loop through the data list. It can be a list of mixed data to be predicted such as DF or numpy.
+        list_of_rows = list()
+        for data_to_predict in data:
+            # PANDAS DF
+            if type(data_to_predict) is pd.DataFrame:
+                list_of_rows.extend(data_to_predict.values.tolist())
+            # NDARRAY
+            else:
+                list_of_rows.extend(data_to_predict)
 
         # batching using application/json
         if self._api_batch_strategy == BatchStrategy.APPLICATION_JSON:
-            batched_data = []
-            # Loop through the data list. It can be a list of mixed data to be predicted such as DF or numpy.
-            for data_to_predict in data:
-                # PANDAS DF
-                if type(data_to_predict) is pd.DataFrame:
-                    for _, row in data_to_predict.iterrows():
-                        batched_data.append(row)
-                    for i in range(0, len(batched_data), self._api_batch_limit):
-                        new_list_of_data.append(
-                            batched_data[i : i + self._api_batch_limit]
-                        )
-                # NDARRAY
-                else:
-                    for row in data_to_predict:
-                        # Pass this information to the send request function to request
-                        batched_data.append(row)
-                    for i in range(0, len(batched_data), self._api_batch_limit):
-                        new_list_of_data.append(
-                            batched_data[i : i + self._api_batch_limit]
-                        )
             jobs = [
-                functools.partial(self.send_batched_request, row_data, *args)
-                for row_data in new_list_of_data
+                functools.partial(
+                    self.send_batched_request,
+                    list_of_rows[i : i + self._api_batch_limit],
+                    *args,
+                )
+                for i in range(0, len(list_of_rows), self._api_batch_limit)
             ]
         # no batching
         else:
-            # loop through the data list. it can be a list of mixed data to be predicted such as DF or numpy
-            for data_to_predict in data:
-                # PANDAS DF
-                if type(data_to_predict) is pd.DataFrame:
-                    for _, row in data_to_predict.iterrows():
-                        # Pass this information to the send request function to request
-                        new_list_of_data.append(row)
-                # NDARRAY
-                else:
-                    for row in data_to_predict:
-                        # Pass this information to the send request function to request
-                        new_list_of_data.append(row)
+            # Pass each row to the send request function to request
             jobs = [
                 functools.partial(self.send_request, row_data, *args)
-                for row_data in new_list_of_data
+                for row_data in list_of_rows
             ]
 
+        # Requests are sent concurrently, bounded by the max connections and rate limit
         if self._api_max_connections == -1 and self._api_rate_limit == -1:
             response_list = await aiometer.run_all(jobs)
         elif self._api_max_connections == -1:
@@ -765,10 +859,7 @@ class Plugin(IModel):
         else:
             raise RuntimeError("Unknown data type.")
 
-        try:
-            return type_to_cast(data)
-        except (ValueError, TypeError):
-            raise
+        return type_to_cast(data)
 
     def _setup_api_authentication(self) -> None:
         """
@@ -811,12 +902,85 @@ class Plugin(IModel):
             Tuple[bool, str]: Returns bool to indicate success, str will indicate the
             error message if failed.
         """
+        # Skip validation if the same api config and schema were validated successfully before.
+        # Reassigning either of them will trigger validation again
+        if (
+            self._last_validated is not None
+            and self._last_validated[0] is self._api_config
+            and self._last_validated[1] is self._api_schema
+        ):
+            return True, ""
+
         try:
-            validate(self._api_config, self._api_schema, cls=self._api_validator)
+            error = best_match(self._get_api_validator().iter_errors(self._api_config))
+            if error is not None:
+                raise error
+            self._last_validated = (self._api_config, self._api_schema)
             return True, ""
         except Exception as error:
             return False, str(error)
 
+    def _setup_api_instance(self) -> None:
+        """
+        A method to set up the authenticated api instance for the api schema. The api instance is created and
+        authenticated once, and reused by plugins with the same api schema and authentication, as parsing the
+        api schema is expensive. The authentication is part of the cache key as the api instance holds the
+        credentials.
+        """
+        cache_key = hashlib.blake2b(
+            json.dumps(
+                [self._api_schema, self._api_config.get("authentication", {})],
+                sort_keys=True,
+            ).encode("utf-8")
+        ).digest()
+        self._api_instance_cache_key = cache_key
+        api_instance = Plugin._api_instance_cache.get(cache_key)
+        if api_instance is not None:
+            # Cached api instance is already authenticated with the same authentication
+            Plugin._api_instance_cache.move_to_end(cache_key)
+            self._api_instance = api_instance
+            return
+
+        # The api schema is already a dictionary, so it is passed in directly instead of
+        # being serialized and parsed again by OpenAPI.loads
+        self._api_instance = OpenAPI(
+            url="",
+            document=self._api_schema,
+            session_factory=Plugin.custom_session_factory,
+            loader=FileSystemLoader(pathlib.Path("")),
+            use_operation_tags=True,
+        )
+
+        # Setup API Authentication. The api instance is only cached after it is authenticated
+        self._setup_api_authentication()
+
+        Plugin._api_instance_cache[cache_key] = self._api_instance
+        if len(Plugin._api_instance_cache) > Plugin._api_instance_cache_size:
+            Plugin._api_instance_cache.popitem(last=False)
+
+    def _get_api_validator(self) -> Any:
+        """
+        A method to return the validator for the api schema. The api schema is checked and
+        the validator is created once, and reused for subsequent validations of the same api schema
+
+        Returns:
+            Any: The validator for the api schema
+        """
+        # The cache entry holds a reference to the api schema, so the id cannot be reused
+        # by another api schema while it is cached
+        cache_key = id(self._api_schema)
+        cached_entry = Plugin._api_validator_cache.get(cache_key)
+        if cached_entry is not None and cached_entry[0] is self._api_schema:
+            Plugin._api_validator_cache.move_to_end(cache_key)
+            return cached_entry[1]
+
+        self._api_validator.check_schema(self._api_schema)
+        api_validator = self._api_validator(self._api_schema)
+        Plugin._api_validator_cache[cache_key] = (self._api_schema, api_validator)
+        if len(Plugin._api_validator_cache) > Plugin._api_validator_cache_size:
+            Plugin._api_validator_cache.popitem(last=False)
+        return api_validator
+
     def _validate_input(self) -> None:
         """
         A method to perform validation on the user's API configuration
@@ -879,7 +1043,10 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
 
     # (1s, 2s, 4s)  Formula: {backoff factor} * (2 ** ({number of total retries} - 1))
     _api_backoff_factor: float = 2.0
-    _api_status_code: list = [429, 500, 502, 503, 504]
+    _api_status_code: frozenset = frozenset({429, 500, 502, 503, 504})
+    # Connection pool keep-alive settings. None keeps every pooled connection alive
+    _api_max_keepalive_connections: Union[int, None] = None
+    _api_keepalive_expiry: float = 30.0
 
     def __init__(
         self,
@@ -903,7 +1070,20 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
         self._max_connection = max_connections
         self._connection_retries = connection_retries
         self._response_error_callback = response_error_callback
-        self._limit_class = OpenAPICustomLimits(no_of_max_connections=1)
+        # Backoff timing for each retry attempt
+        self._backoff_schedule = tuple(
+            int(self._api_backoff_factor * (2 ** (attempt - 1)))
+            for attempt in range(max(self._connection_retries, 0))
+        )
+        # The transport is shared by the async clients, so the connection pool is
+        # limited by the max connections instead of a single connection
+        self._limit_class = OpenAPICustomLimits(
+            no_of_max_connections=None
+            if self._max_connection == -1
+            else self._max_connection,
+            no_of_max_keepalive_connections=self._api_max_keepalive_connections,
+            keepalive_expiry=self._api_keepalive_expiry,
+        )
 
         # Initialize super class
         super().__init__(
@@ -913,6 +1093,20 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
             limits=self._limit_class,
         )
 
+    async def aclose(self) -> None:
+        """
+        An async method that is called when the async client is closed.
+        The transport is shared by the async clients, so the connections are kept open for reuse.
+        Use close_connections to close the connections.
+        """
+        pass
+
+    async def close_connections(self) -> None:
+        """
+        An async method to close the connections in the connection pool
+        """
+        await super().aclose()
+
     async def handle_attempt_retries(
         self, attempt: int, status_code: Union[None, int]
     ) -> None:
@@ -934,7 +1128,7 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
             # if the status code is 429 (too many requests)
             backoff_timing = self._rate_limit_timeout
         else:
-            backoff_timing = int(self._api_backoff_factor * (2 ** (attempt - 1)))
+            backoff_timing = self._backoff_schedule[attempt]
         await asyncio.sleep(backoff_timing)
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
@@ -980,18 +1174,17 @@ class OpenAPICustomTransport(httpx.AsyncHTTPTransport):
                         f"Response status code: {response.status_code} "
                         f"({http.HTTPStatus(response.status_code).name})"
                     )
+                    # Release the connection back to the pool before retrying
+                    await response.aclose()
                     await self.handle_attempt_retries(attempt, response.status_code)
-            finally:
-                # Exceeded the number of attempts
-                end_time = time.time()
-                connection_elapsed_time = round((end_time - start_time), 1)
-                if attempt == self._connection_retries:
-                    custom_error_message = f"Maximum retries exceeded ({self._connection_retries}) \
-                        after {connection_elapsed_time}s."
-                    await self._response_error_callback(
-                        f"{custom_error_message} {error_message}"
-                    )
-                    raise RuntimeError(f"{custom_error_message} {error_message}")
+
+        # Exceeded the number of attempts
+        end_time = time.time()
+        connection_elapsed_time = round((end_time - start_time), 1)
+        custom_error_message = f"Maximum retries exceeded ({self._connection_retries}) \
+            after {connection_elapsed_time}s."
+        await self._response_error_callback(f"{custom_error_message} {error_message}")
+        raise RuntimeError(f"{custom_error_message} {error_message}")
 
 
 class OpenAPICustomLimits(httpx.Limits):
@@ -1001,12 +1194,14 @@ class OpenAPICustomLimits(httpx.Limits):
 
     def __init__(
         self,
-        no_of_max_connections: int,
+        no_of_max_connections: Union[int, None],
+        no_of_max_keepalive_connections: Union[int, None] = None,
+        keepalive_expiry: Union[float, None] = None,
     ):
         # Save the variables
         self._max_connections = no_of_max_connections
-        self._max_keepalive_connections = None
-        self._keepalive_expiry = None
+        self._max_keepalive_connections = no_of_max_keepalive_connections
+        self._keepalive_expiry = keepalive_expiry
 
         # Initialize super class
         super().__init__(
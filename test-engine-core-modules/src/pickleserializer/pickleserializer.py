@@ -54,10 +54,7 @@ class Plugin(ISerializer):
         Returns:
             Any: deserialized data
         """
-        try:
-            return pickle.load(open(data_path, "rb"))
-        except Exception:
-            raise
+        return pickle.load(open(data_path, "rb"))
 
     @staticmethod
     def get_serializer_plugin_type() -> SerializerPluginType:
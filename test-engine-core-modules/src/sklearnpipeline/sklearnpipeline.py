@@ -139,14 +139,11 @@ class Plugin(IPipeline):
         Returns:
             Any: predicted result
         """
-        try:
-            if isinstance(data, list):
-                for item in data:
-                    return self._pipeline.predict(item)
-            else:
-                return self._pipeline.predict(data)
-        except Exception:
-            raise
+        if isinstance(data, list):
+            for item in data:
+                return self._pipeline.predict(item)
+        else:
+            return self._pipeline.predict(data)
 
     def predict_proba(self, data: Any, *args) -> Any:
         """
@@ -158,14 +155,11 @@ class Plugin(IPipeline):
         Returns:
             Any: predicted result
         """
-        try:
-            if isinstance(data, list):
-                for item in data:
-                    return self._pipeline.predict_proba(item)
-            else:
-                return self._pipeline.predict_proba(data)
-        except Exception:
-            raise
+        if isinstance(data, list):
+            for item in data:
+                return self._pipeline.predict_proba(item)
+        else:
+            return self._pipeline.predict_proba(data)
 
     def score(self, data: Any, y_true: Any) -> Any:
         """
@@ -178,10 +172,7 @@ class Plugin(IPipeline):
         Returns:
             Any: score result
         """
-        try:
-            return self._pipeline.score(data, y_true)
-        except Exception:
-            raise
+        return self._pipeline.score(data, y_true)
 
     def _identify_pipeline_algorithm(self, pipeline: Any) -> Tuple[bool, str]:
         """
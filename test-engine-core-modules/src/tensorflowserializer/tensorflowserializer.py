@@ -54,10 +54,7 @@ class Plugin(ISerializer):
         Returns:
             Any: deserialized data
         """
-        try:
-            return keras.models.load_model(data_path)
-        except Exception:
-            raise
+        return keras.models.load_model(data_path)
 
     @staticmethod
     def get_serializer_plugin_type() -> SerializerPluginType:
@@ -136,20 +136,17 @@ class Plugin(IModel):
         Returns:
             Any: predicted result
         """
-        try:
-            if isinstance(data, list):
-                for item in data:
-                    if self._model_algorithm == "xgboost.core.Booster":
-                        return self._model.predict(xgboost.DMatrix(item))
-                    else:
-                        return self._model.predict(item)
-            else:
+        if isinstance(data, list):
+            for item in data:
                 if self._model_algorithm == "xgboost.core.Booster":
-                    return self._model.predict(xgboost.DMatrix(data))
+                    return self._model.predict(xgboost.DMatrix(item))
                 else:
-                    return self._model.predict(data)
-        except Exception:
-            raise
+                    return self._model.predict(item)
+        else:
+            if self._model_algorithm == "xgboost.core.Booster":
+                return self._model.predict(xgboost.DMatrix(data))
+            else:
+                return self._model.predict(data)
 
     def predict_proba(self, data: Any, *args) -> Any:
         """
@@ -161,13 +158,10 @@ class Plugin(IModel):
         Returns:
             Any: predicted result
         """
-        try:
-            if self._model_algorithm == "xgboost.core.Booster":
-                return self._model.predict_proba(xgboost.DMatrix(data))
-            else:
-                return self._model.predict_proba(data)
-        except Exception:
-            raise
+        if self._model_algorithm == "xgboost.core.Booster":
+            return self._model.predict_proba(xgboost.DMatrix(data))
+        else:
+            return self._model.predict_proba(data)
 
     def score(self, data: Any, y_true: Any) -> Any:
         """
@@ -44,6 +44,24 @@ class TestCollectionDelimiterSerializer:
                                        ['Belle', '29', 'F'], ['Chansey', '50', 'F']],
                                       (DelimiterType.COLON, ":"),
                                       "src/delimiterdata/user_defined_files/sv_colon.txt")
+            ),
+            (
+                    "tests/delimiterserializer/single_column_header_only.txt",
+                    DelimiterMetadata([['x']],
+                                      (DelimiterType.COMMA, ","),
+                                      "tests/delimiterserializer/single_column_header_only.txt")
+            ),
+            (
+                    "tests/delimiterserializer/single_column_names.txt",
+                    DelimiterMetadata([['name'], ['John Smith'], ['Jane Doe']],
+                                      (DelimiterType.COMMA, ","),
+                                      "tests/delimiterserializer/single_column_names.txt")
+            ),
+            (
+                    "tests/delimiterserializer/single_column_shared_letters.txt",
+                    DelimiterMetadata([['name'], ['James'], ['Mark'], ['Paul']],
+                                      (DelimiterType.COMMA, ","),
+                                      "tests/delimiterserializer/single_column_shared_letters.txt")
             )
         ],
     )
@@ -57,6 +75,64 @@ class TestCollectionDelimiterSerializer:
             assert output.get_delimiter_type() == expected_output.get_delimiter_type()
             assert output.get_data_path() == expected_output.get_data_path()
 
+    @pytest.mark.parametrize(
+        "data_path, delimiter, expected_output",
+        [
+            (
+                    "src/delimiterdata/user_defined_files/sv_pipe.txt",
+                    "|",
+                    DelimiterMetadata([['Name', 'Age', 'Gender'], ['Alex', '30', 'M'],
+                                       ['Belle', '29', 'F'], ['Chansey', '50', 'F']],
+                                      (DelimiterType.PIPE, "|"),
+                                      "src/delimiterdata/user_defined_files/sv_pipe.txt")
+            ),
+            (
+                    "src/delimiterdata/user_defined_files/sv_tab.txt",
+                    "\t",
+                    DelimiterMetadata([['Name', 'Age', 'Gender'], ['Alex', '30', 'M'],
+                                       ['Belle', '29', 'F'], ['Chansey', '50', 'F']],
+                                      (DelimiterType.TAB, "\t"),
+                                      "src/delimiterdata/user_defined_files/sv_tab.txt")
+            ),
+        ],
+    )
+    def test_deserialize_data_with_delimiter(self, data_path, delimiter, expected_output):
+        output = Plugin.deserialize_data(data_path, delimiter)
+        assert output.get_data() == expected_output.get_data()
+        assert output.get_delimiter_char() == expected_output.get_delimiter_char()
+        assert output.get_delimiter_type() == expected_output.get_delimiter_type()
+        assert output.get_data_path() == expected_output.get_data_path()
+
+    def test_deserialize_data_with_unsupported_delimiter(self):
+        with pytest.raises(ValueError) as exc_info:
+            Plugin.deserialize_data("tests/delimiterserializer/special_delimiter.txt", "-")
+        assert str(exc_info.value) == "The delimiter is not supported."
+
+    @pytest.mark.parametrize(
+        "data_path, delimiter, expected_output",
+        [
+            (
+                    "src/delimiterdata/user_defined_files/sv_colon.txt",
+                    None,
+                    [['Name', 'Age', 'Gender'], ['Alex', '30', 'M'],
+                     ['Belle', '29', 'F'], ['Chansey', '50', 'F']]
+            ),
+            (
+                    "src/delimiterdata/user_defined_files/sv_semicolon.txt",
+                    ";",
+                    [['Name', 'Age', 'Gender'], ['Alex', '30', 'M'],
+                     ['Belle', '29', 'F'], ['Chansey', '50', 'F']]
+            ),
+        ],
+    )
+    def test_deserialize_data_iter(self, data_path, delimiter, expected_output):
+        assert list(Plugin.deserialize_data_iter(data_path, delimiter)) == expected_output
+
+    def test_deserialize_data_iter_with_unsupported_delimiter(self):
+        with pytest.raises(ValueError) as exc_info:
+            next(Plugin.deserialize_data_iter("tests/delimiterserializer/special_delimiter.txt"))
+        assert str(exc_info.value) == "The delimiter is not supported."
+
     @pytest.mark.parametrize(
         "data_path, expected_error_message",
         [
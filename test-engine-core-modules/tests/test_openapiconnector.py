@@ -0,0 +1,204 @@
+import asyncio
+import threading
+
+import httpx
+import numpy as np
+import pandas as pd
+import pytest
+from test_engine_core.utils.json_utils import load_schema_file
+
+from src.openapiconnector.openapiconnector import (
+    BatchStrategy,
+    OpenAPICustomTransport,
+    Plugin,
+)
+
+
+class TestCollectionOpenAPIConnector:
+    api_schema_path = "src/openapiconnector/user_defined_files/test_api_schema.json"
+    api_config_path = "src/openapiconnector/user_defined_files/test_api_config.json"
+
+    def test_cleanup_with_predict_in_flight(self, mocker):
+        api_schema = load_schema_file(self.api_schema_path)
+        api_config = load_schema_file(self.api_config_path)
+        plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        other_plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        assert plugin.setup() == (True, "")
+        assert other_plugin.setup() == (True, "")
+
+        request_started = threading.Event()
+
+        async def make_request(data, *args):
+            request_started.set()
+            await asyncio.sleep(0.2)
+            return data
+
+        mocker.patch.object(other_plugin, "make_request", make_request)
+        predictions = []
+        predict_thread = threading.Thread(
+            target=lambda: predictions.append(other_plugin.predict([1, 2, 3])),
+            daemon=True,
+        )
+        predict_thread.start()
+        assert request_started.wait(timeout=5)
+        plugin.cleanup()
+        predict_thread.join(timeout=5)
+        assert not predict_thread.is_alive()
+        assert predictions == [[1, 2, 3]]
+
+        # the event loop is still used by the other plugin
+        assert Plugin._api_event_loop is not None
+        assert other_plugin.predict([4, 5]) == [4, 5]
+        other_plugin.cleanup()
+
+    def test_cleanup_with_last_plugin(self, mocker):
+        api_schema = load_schema_file(self.api_schema_path)
+        api_config = load_schema_file(self.api_config_path)
+        plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        other_plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        assert plugin.setup() == (True, "")
+        assert other_plugin.setup() == (True, "")
+        event_loop_thread = Plugin._api_event_loop_thread
+        transport = Plugin._get_api_transport()
+        spy_close_connections = mocker.spy(transport, "close_connections")
+
+        plugin.cleanup()
+        plugin.cleanup()
+        assert event_loop_thread.is_alive()
+        assert Plugin._api_event_loop_users == 1
+        spy_close_connections.assert_not_called()
+
+        other_plugin.cleanup()
+        assert not event_loop_thread.is_alive()
+        assert Plugin._api_event_loop is None
+        assert Plugin._api_event_loop_thread is None
+        assert Plugin._api_event_loop_users == 0
+        assert Plugin._api_transports == {}
+        spy_close_connections.assert_called_once()
+
+    def test_cleanup_evicts_api_instance(self):
+        api_schema = load_schema_file(self.api_schema_path)
+        api_config = load_schema_file(self.api_config_path)
+        plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        other_plugin = Plugin(api_schema=api_schema, api_config=api_config)
+        assert plugin.setup() == (True, "")
+        assert other_plugin.setup() == (True, "")
+        assert plugin._api_instance is other_plugin._api_instance
+        assert Plugin._api_instance_cache.get(plugin._api_instance_cache_key) is plugin._api_instance
+
+        api_instance_cache_key = plugin._api_instance_cache_key
+        plugin.cleanup()
+        assert api_instance_cache_key not in Plugin._api_instance_cache
+        # the other plugin keeps its api instance
+        assert other_plugin._api_instance is not None
+        other_plugin.cleanup()
+
+    @pytest.mark.parametrize(
+        "batch_strategy, batch_limit, expected_chunk_sizes",
+        [
+            (BatchStrategy.APPLICATION_JSON, 3, [3, 3, 1]),
+            (BatchStrategy.APPLICATION_JSON, 5, [5, 2]),
+            (BatchStrategy.APPLICATION_JSON, 10, [7]),
+        ],
+    )
+    def test_make_request_with_batched_mixed_data(
+        self, mocker, batch_strategy, batch_limit, expected_chunk_sizes
+    ):
+        mocker.patch.object(Plugin, "_api_batch_strategy", batch_strategy)
+        mocker.patch.object(Plugin, "_api_batch_limit", batch_limit)
+        mock_send_batched_request = mocker.patch.object(
+            Plugin,
+            "send_batched_request",
+            side_effect=lambda list_of_rows: httpx.Response(
+                200, json=[int(list(row)[0]) for row in list_of_rows]
+            ),
+        )
+        mock_send_request = mocker.patch.object(Plugin, "send_request")
+        plugin = Plugin(
+            api_schema={"paths": {}},
+            api_config={
+                "responseBody": {"schema": {"type": "array", "items": {"type": "integer"}}}
+            },
+        )
+        data = [
+            np.array([[1, 10], [2, 20]]),
+            pd.DataFrame({"a": [3, 4, 5, 6, 7], "b": [30, 40, 50, 60, 70]}),
+        ]
+
+        assert asyncio.run(plugin.make_request(data)) == [1, 2, 3, 4, 5, 6, 7]
+        chunks = [call.args[0] for call in mock_send_batched_request.await_args_list]
+        assert [len(chunk) for chunk in chunks] == expected_chunk_sizes
+        assert [list(row) for chunk in chunks for row in chunk] == [
+            [1, 10], [2, 20], [3, 30], [4, 40], [5, 50], [6, 60], [7, 70]
+        ]
+        mock_send_request.assert_not_awaited()
+
+    def test_make_request_with_mixed_data(self, mocker):
+        mocker.patch.object(Plugin, "_api_batch_strategy", BatchStrategy.NONE)
+        mock_send_request = mocker.patch.object(
+            Plugin,
+            "send_request",
+            side_effect=lambda row: httpx.Response(200, text=str(int(list(row)[0]))),
+        )
+        mock_send_batched_request = mocker.patch.object(Plugin, "send_batched_request")
+        plugin = Plugin(
+            api_schema={"paths": {}},
+            api_config={"responseBody": {"schema": {"type": "integer"}}},
+        )
+        data = [
+            np.array([[1, 10], [2, 20]]),
+            pd.DataFrame({"a": [3, 4, 5, 6, 7], "b": [30, 40, 50, 60, 70]}),
+        ]
+
+        assert asyncio.run(plugin.make_request(data)) == [1, 2, 3, 4, 5, 6, 7]
+        assert [list(call.args[0]) for call in mock_send_request.await_args_list] == [
+            [1, 10], [2, 20], [3, 30], [4, 40], [5, 50], [6, 60], [7, 70]
+        ]
+        mock_send_batched_request.assert_not_awaited()
+
+    @pytest.mark.parametrize(
+        "status_codes, expected_backoff_timings",
+        [
+            ([200], []),
+            ([500, 200], [1]),
+            ([500, 500, 500, 200], [1, 2, 4]),
+        ],
+    )
+    def test_handle_async_request_with_retries(
+        self, mocker, status_codes, expected_backoff_timings
+    ):
+        mocker.patch(
+            "httpx.AsyncHTTPTransport.handle_async_request",
+            side_effect=[httpx.Response(status_code) for status_code in status_codes],
+        )
+        mock_sleep = mocker.patch("asyncio.sleep")
+        response_error_callback = mocker.AsyncMock()
+        transport = OpenAPICustomTransport(
+            False, None, 1, 3.0, BatchStrategy.NONE, 1, 5, 3, response_error_callback
+        )
+
+        response = asyncio.run(
+            transport.handle_async_request(httpx.Request("POST", "https://localhost:5000"))
+        )
+        assert response.status_code == 200
+        assert [call.args[0] for call in mock_sleep.await_args_list] == expected_backoff_timings
+        response_error_callback.assert_not_awaited()
+
+    def test_handle_async_request_with_retries_exceeded(self, mocker):
+        mocker.patch(
+            "httpx.AsyncHTTPTransport.handle_async_request",
+            side_effect=[httpx.Response(500) for _ in range(4)],
+        )
+        mocker.patch("asyncio.sleep")
+        response_error_callback = mocker.AsyncMock()
+        transport = OpenAPICustomTransport(
+            False, None, 1, 3.0, BatchStrategy.NONE, 1, 5, 3, response_error_callback
+        )
+
+        with pytest.raises(RuntimeError) as exc_info:
+            asyncio.run(
+                transport.handle_async_request(httpx.Request("POST", "https://localhost:5000"))
+            )
+        assert str(exc_info.value).startswith("Maximum retries exceeded (3)")
+        assert str(exc_info.value).endswith("Response status code: 500 (INTERNAL_SERVER_ERROR)")
+        response_error_callback.assert_awaited_once()